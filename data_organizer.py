@@ -7,169 +7,610 @@ based on different organizational approaches and data types.
 """
 
 import os
+import sys
 import json
+import argparse
+import asyncio
+import heapq
+import multiprocessing
+from collections import Counter, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
 
+try:
+    import orjson
+except ImportError:  # optional: plans are written with the json module instead
+    orjson = None
 
-class DataOrganizerSuggester:
-    """Suggests folder structures for organizing unstructured data."""
+
+def _freeze(value):
+    """
+    Recursively convert dicts and lists into read-only mappings and tuples.
     
-    def __init__(self):
-        self.base_structures = {
-            'by_type': {
-                'Documents': {
-                    'PDFs': [],
-                    'Word_Documents': [],
-                    'Spreadsheets': [],
-                    'Presentations': [],
-                    'Text_Files': [],
-                    'Archives': []
-                },
-                'Media': {
-                    'Images': {
-                        'Photos': [],
-                        'Screenshots': [],
-                        'Graphics': [],
-                        'Icons': []
-                    },
-                    'Videos': {
-                        'Personal': [],
-                        'Work': [],
-                        'Educational': []
-                    },
-                    'Audio': {
-                        'Music': [],
-                        'Recordings': [],
-                        'Podcasts': []
-                    }
-                },
-                'Code_and_Development': {
-                    'Projects': [],
-                    'Scripts': [],
-                    'Documentation': [],
-                    'Resources': []
-                },
-                'Data_Files': {
-                    'Databases': [],
-                    'CSV_Files': [],
-                    'JSON_Files': [],
-                    'XML_Files': [],
-                    'Logs': []
-                },
-                'Miscellaneous': {
-                    'Temporary': [],
-                    'Unsorted': [],
-                    'To_Review': []
-                }
+    Frozen structures can be shared between all instances without any
+    risk of one caller mutating another's folder layout. Strings are
+    interned, so folder names repeated across structures share one object
+    and lookups with interned keys compare by identity.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({_freeze(key): _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _build_by_type():
+    """Build the structure that groups files by their format."""
+    return {
+        'Documents': {
+            'PDFs': [],
+            'Word_Documents': [],
+            'Spreadsheets': [],
+            'Presentations': [],
+            'Text_Files': [],
+            'Archives': []
+        },
+        'Media': {
+            'Images': {
+                'Photos': [],
+                'Screenshots': [],
+                'Graphics': [],
+                'Icons': []
             },
-            
-            'by_project': {
-                'Active_Projects': {
-                    'Project_A': {
-                        'Documents': [],
-                        'Media': [],
-                        'Data': [],
-                        'Resources': []
-                    },
-                    'Project_B': {
-                        'Documents': [],
-                        'Media': [],
-                        'Data': [],
-                        'Resources': []
-                    }
-                },
-                'Completed_Projects': {
-                    'Archive_2024': [],
-                    'Archive_2023': []
-                },
-                'Templates_and_Resources': {
-                    'Document_Templates': [],
-                    'Media_Assets': [],
-                    'Reference_Materials': []
-                },
-                'Inbox': {
-                    'New_Items': [],
-                    'To_Categorize': []
-                }
+            'Videos': {
+                'Personal': [],
+                'Work': [],
+                'Educational': []
             },
-            
-            'by_date': {
-                '2024': {
-                    'Q1_Jan_Mar': {
-                        'January': [],
-                        'February': [],
-                        'March': []
-                    },
-                    'Q2_Apr_Jun': {
-                        'April': [],
-                        'May': [],
-                        'June': []
-                    },
-                    'Q3_Jul_Sep': {
-                        'July': [],
-                        'August': [],
-                        'September': []
-                    },
-                    'Q4_Oct_Dec': {
-                        'October': [],
-                        'November': [],
-                        'December': []
-                    }
-                },
-                '2023': {
-                    'Archive': []
-                }
+            'Audio': {
+                'Music': [],
+                'Recordings': [],
+                'Podcasts': []
+            }
+        },
+        'Code_and_Development': {
+            'Projects': [],
+            'Scripts': [],
+            'Documentation': [],
+            'Resources': []
+        },
+        'Data_Files': {
+            'Databases': [],
+            'CSV_Files': [],
+            'JSON_Files': [],
+            'XML_Files': [],
+            'Logs': []
+        },
+        'Miscellaneous': {
+            'Temporary': [],
+            'Unsorted': [],
+            'To_Review': []
+        }
+    }
+
+
+def _build_by_project():
+    """Build the structure that groups files into project folders."""
+    return {
+        'Active_Projects': {
+            'Project_A': {
+                'Documents': [],
+                'Media': [],
+                'Data': [],
+                'Resources': []
+            },
+            'Project_B': {
+                'Documents': [],
+                'Media': [],
+                'Data': [],
+                'Resources': []
+            }
+        },
+        'Completed_Projects': {
+            'Archive_2024': [],
+            'Archive_2023': []
+        },
+        'Templates_and_Resources': {
+            'Document_Templates': [],
+            'Media_Assets': [],
+            'Reference_Materials': []
+        },
+        'Inbox': {
+            'New_Items': [],
+            'To_Categorize': []
+        }
+    }
+
+
+def _build_by_date():
+    """Build the structure that organizes files chronologically by year and quarter."""
+    return {
+        '2024': {
+            'Q1_Jan_Mar': {
+                'January': [],
+                'February': [],
+                'March': []
+            },
+            'Q2_Apr_Jun': {
+                'April': [],
+                'May': [],
+                'June': []
             },
-            
-            'hybrid_approach': {
-                '01_Inbox': {
-                    'New_Items': [],
-                    'Processing': [],
-                    'Quick_Access': []
-                },
-                '02_Active_Work': {
-                    'Current_Projects': {
-                        'Project_Alpha': {
-                            'Documents': [],
-                            'Media': [],
-                            'Data': []
-                        }
-                    },
-                    'Daily_Tasks': [],
-                    'Meetings_and_Notes': []
-                },
-                '03_Resources': {
-                    'Templates': [],
-                    'Reference_Materials': [],
-                    'Tools_and_Utilities': []
-                },
-                '04_Archive': {
-                    'By_Year': {
-                        '2024': [],
-                        '2023': []
-                    },
-                    'Completed_Projects': []
-                },
-                '05_Personal': {
-                    'Photos': [],
+            'Q3_Jul_Sep': {
+                'July': [],
+                'August': [],
+                'September': []
+            },
+            'Q4_Oct_Dec': {
+                'October': [],
+                'November': [],
+                'December': []
+            }
+        },
+        '2023': {
+            'Archive': []
+        }
+    }
+
+
+def _build_hybrid_approach():
+    """Build the numbered workflow structure combining the other approaches."""
+    return {
+        '01_Inbox': {
+            'New_Items': [],
+            'Processing': [],
+            'Quick_Access': []
+        },
+        '02_Active_Work': {
+            'Current_Projects': {
+                'Project_Alpha': {
                     'Documents': [],
-                    'Media': []
+                    'Media': [],
+                    'Data': []
                 }
-            }
+            },
+            'Daily_Tasks': [],
+            'Meetings_and_Notes': []
+        },
+        '03_Resources': {
+            'Templates': [],
+            'Reference_Materials': [],
+            'Tools_and_Utilities': []
+        },
+        '04_Archive': {
+            'By_Year': {
+                '2024': [],
+                '2023': []
+            },
+            'Completed_Projects': []
+        },
+        '05_Personal': {
+            'Photos': [],
+            'Documents': [],
+            'Media': []
         }
+    }
+
+
+class _LazyStructures(Mapping):
+    """
+    Read-only mapping of approach name to folder structure.
+    
+    Each structure is built and frozen on first access only, so callers that
+    use a single approach never pay for the others.
+    """
+    
+    def __init__(self, builders):
+        self._builders = builders
+        self._built = {}
+    
+    def __getitem__(self, approach):
+        structure = self._built.get(approach)
+        if structure is None:
+            # setdefault keeps a single shared object if two threads race here
+            structure = self._built.setdefault(approach, _freeze(self._builders[approach]()))
+        return structure
+    
+    def __contains__(self, approach):
+        return approach in self._builders
+    
+    def __iter__(self):
+        return iter(self._builders)
+    
+    def __len__(self):
+        return len(self._builders)
+    
+    def built_items(self):
+        """Return (approach, structure) pairs for the structures built so far."""
+        return list(self._built.items())
+
+
+_BUILDERS = {
+    'by_type': _build_by_type,
+    'by_project': _build_by_project,
+    'by_date': _build_by_date,
+    'hybrid_approach': _build_hybrid_approach
+}
+
+_BASE_STRUCTURES = _LazyStructures(_BUILDERS)
+
+_FILE_TYPE_MAPPINGS = _freeze({
+    'documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt'],
+    'spreadsheets': ['.xls', '.xlsx', '.csv', '.ods'],
+    'presentations': ['.ppt', '.pptx', '.odp'],
+    'images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.svg'],
+    'videos': ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'],
+    'audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg'],
+    'archives': ['.zip', '.rar', '.7z', '.tar', '.gz', '.tar.gz', '.tar.bz2', '.tar.xz'],
+    'code': ['.py', '.js', '.html', '.css', '.java', '.cpp', '.c'],
+    'data': ['.json', '.xml', '.sql', '.db', '.sqlite']
+})
+
+_EXT_TO_CATEGORY = _freeze({
+    ext: category
+    for category, exts in _FILE_TYPE_MAPPINGS.items()
+    for ext in exts
+})
+
+
+def _compound_extensions(mappings):
+    """Group multi-dot extensions such as ``.tar.gz`` by their last suffix, longest first."""
+    compounds = {}
+    for exts in mappings.values():
+        for ext in exts:
+            if ext.count('.') > 1:
+                compounds.setdefault(os.path.splitext(ext)[1], []).append(ext)
+    return _freeze({
+        suffix: sorted(exts, key=len, reverse=True)
+        for suffix, exts in compounds.items()
+    })
+
+
+_COMPOUND_EXTS = _compound_extensions(_FILE_TYPE_MAPPINGS)
+
+# Number of largest files listed in an analysis; all of them are still counted
+_MAX_LARGE_FILES = 100
+
+_CATEGORY_SETS = MappingProxyType({
+    category: frozenset(exts)
+    for category, exts in _FILE_TYPE_MAPPINGS.items()
+})
+
+# Directories listed per thread-pool task when walking a tree
+_DIRS_PER_TASK = 32
+
+# Files of these types are practically never >100MB, so they are not stat'ed;
+# every other type, including unknown ones, is still measured
+_SMALL_FILE_EXTS = _CATEGORY_SETS['documents'] | _CATEGORY_SETS['code'] | _CATEGORY_SETS['presentations']
+
+
+def _json_default(value):
+    """Serialize the read-only mappings used for shared structures as JSON objects."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _flatten(structure):
+    """
+    List the folders of a structure in creation order, without any I/O.
+    
+    Args:
+        structure (Mapping): The folder structure to flatten
+    
+    Returns:
+        tuple: Folder paths relative to the structure root, each parent
+               before its children
+    """
+    folder_paths = []
+    
+    def flatten_recursive(current_path, struct):
+        for folder_name, contents in struct.items():
+            folder_path = os.path.join(current_path, folder_name)
+            folder_paths.append(folder_path)
+            if isinstance(contents, Mapping):
+                flatten_recursive(folder_path, contents)
+    
+    flatten_recursive('', structure)
+    return tuple(folder_paths)
+
+
+@lru_cache(maxsize=None)
+def _flatten_structure(approach):
+    """Flatten one of the built-in structures; safe to cache as they are read-only."""
+    return _flatten(_BASE_STRUCTURES[approach])
+
+
+def _materialize(folder_paths):
+    """Create the given folders (path strings), each with a README file if it has none yet."""
+    for folder_path in folder_paths:
+        os.makedirs(folder_path, exist_ok=True)
+        readme_path = os.path.join(folder_path, "README.md")
+        if not os.path.lexists(readme_path):
+            folder_name = os.path.basename(folder_path)
+            with open(readme_path, 'w') as f:
+                f.write(f"# {folder_name}\n\nThis folder is for organizing {folder_name.lower().replace('_', ' ')} files.\n")
+
+
+# Indentation prefixes for the usual structure depths, reused between lines
+_INDENTS = tuple("  " * depth for depth in range(16))
+
+
+def _indent(depth):
+    """Return the indentation prefix for ``depth``."""
+    return _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
+
+
+def _render(structure, indent=0):
+    """
+    Render a folder structure as a list of display lines.
+    
+    Walks the structure with an explicit stack of item iterators, so deep
+    structures need neither recursion nor one write per line.
+    """
+    lines = []
+    stack = [(iter(structure.items()), indent)]
+    while stack:
+        items, depth = stack[-1]
+        for folder_name, contents in items:
+            lines.append(f"{_indent(depth)}📁 {folder_name}")
+            if isinstance(contents, Mapping):
+                # Descend now; this level resumes once the child is done
+                stack.append((iter(contents.items()), depth + 1))
+                break
+            if isinstance(contents, (list, tuple)):
+                file_indent = _indent(depth + 1)
+                lines.extend(f"{file_indent}📄 {item}" for item in contents)
+        else:
+            stack.pop()
+    return lines
+
+
+def _extension(name):
+    """
+    Return the lowercase extension of a file name.
+    
+    Known multi-dot extensions (``archive.tar.gz``) are returned whole. Only
+    names ending in the last suffix of one of them pay for the extra check.
+    """
+    suffix = os.path.splitext(name)[1].lower()
+    compounds = _COMPOUND_EXTS.get(suffix)
+    if compounds:
+        lowered = name.lower()
+        for compound in compounds:
+            if len(lowered) > len(compound) and lowered.endswith(compound):
+                return compound
+    return suffix
+
+
+def _list_directory(path):
+    """
+    List one directory without recursing, skipping symbolic links.
+    
+    Returns:
+        tuple: (subdirectory paths, ``os.DirEntry`` files)
+    
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    subdirs = []
+    files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                files.append(entry)
+    return subdirs, files
+
+
+def _iter_files(path):
+    """
+    Yield ``os.DirEntry`` objects for every file below ``path``.
+    
+    Directories are listed with _list_directory, so the symlink and file
+    type rules are the same as for the full scan, and walked depth-first
+    with an explicit stack. Unreadable directories are skipped, as
+    os.walk does by default.
+    """
+    pending = [path]
+    while pending:
+        try:
+            subdirs, files = _list_directory(pending.pop())
+        except OSError:
+            continue
+        yield from files
+        # Reversed so subdirectories are visited in listing order
+        pending.extend(reversed(subdirs))
+
+
+def _round_robin(iterables):
+    """Yield one item from each iterable in turn until all are exhausted."""
+    iterators = deque(iter(iterable) for iterable in iterables)
+    while iterators:
+        iterator = iterators.popleft()
+        for item in iterator:
+            yield item
+            iterators.append(iterator)
+            break
+
+
+def _scan_entries(entries, ext_to_category):
+    """
+    Aggregate file statistics over an iterable of ``os.DirEntry`` files.
+    
+    Args:
+        entries (iterable): The ``os.DirEntry`` files to aggregate
+        ext_to_category (dict): Maps a lowercase extension to its category
+    
+    Returns:
+        tuple: (file count, file type counts, category counts, large file count,
+                min-heap of the largest (size_mb, path) pairs)
+    """
+    count = 0
+    file_types = Counter()
+    category_counts = Counter()
+    large_count = 0
+    large_heap = []
+    
+    for entry in entries:
+        count += 1
+        # Interned so the counter and category lookups hit the identity fast path
+        suffix = sys.intern(_extension(entry.name))
         
-        self.file_type_mappings = {
-            'documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt'],
-            'spreadsheets': ['.xls', '.xlsx', '.csv', '.ods'],
-            'presentations': ['.ppt', '.pptx', '.odp'],
-            'images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.svg'],
-            'videos': ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'],
-            'audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg'],
-            'archives': ['.zip', '.rar', '.7z', '.tar', '.gz'],
-            'code': ['.py', '.js', '.html', '.css', '.java', '.cpp', '.c'],
-            'data': ['.json', '.xml', '.sql', '.db', '.sqlite']
-        }
+        # Count file types and their categories
+        file_types[suffix] += 1
+        category = ext_to_category.get(suffix)
+        if category:
+            category_counts[category] += 1
+        
+        # Check for large files (>100MB)
+        if suffix in _SMALL_FILE_EXTS:
+            continue
+        try:
+            size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            # Vanished or unreadable since the directory was listed
+            continue
+        size_mb = size / (1024 * 1024)
+        if size_mb > 100:
+            large_count += 1
+            _push_large_file(large_heap, (size_mb, entry.path))
+    
+    return count, file_types, category_counts, large_count, large_heap
+
+
+def _push_large_file(large_heap, item):
+    """Add a (size_mb, path) pair, keeping only the _MAX_LARGE_FILES largest."""
+    if len(large_heap) < _MAX_LARGE_FILES:
+        heapq.heappush(large_heap, item)
+    else:
+        heapq.heappushpop(large_heap, item)
+
+
+class _ScanTotals:
+    """Running file statistics, merged from any number of _scan_entries results."""
+    
+    def __init__(self):
+        self.total_files = 0
+        self.file_types = Counter()
+        self.category_counts = Counter()
+        self.large_file_count = 0
+        self.large_heap = []
+    
+    def add(self, scan):
+        count, file_types, category_counts, large_count, large_heap = scan
+        self.total_files += count
+        self.file_types.update(file_types)
+        self.category_counts.update(category_counts)
+        self.large_file_count += large_count
+        for item in large_heap:
+            _push_large_file(self.large_heap, item)
+
+
+def _scan_directories(path, ext_to_category):
+    """
+    Scan the files of ``path`` and of up to _DIRS_PER_TASK directories below it.
+    
+    Batching several directories per call keeps the hand-off to the event
+    loop cheap relative to the scandir/stat work done in the thread.
+    
+    Returns:
+        tuple: (directories still to scan, _scan_entries result); unreadable
+               directories count as empty, as os.walk does by default
+    """
+    pending = [path]
+    files = []
+    for _ in range(_DIRS_PER_TASK):
+        if not pending:
+            break
+        try:
+            subdirs, dir_files = _list_directory(pending.pop())
+        except OSError:
+            continue
+        pending.extend(subdirs)
+        files.extend(dir_files)
+    return pending, _scan_entries(files, ext_to_category)
+
+
+async def _scan_tree_async(root_dirs, ext_to_category, totals, max_workers):
+    """
+    Scan every directory below ``root_dirs`` into ``totals``.
+    
+    Directories are processed from a shared queue by ``max_workers``
+    coroutines, each handing the blocking scandir/stat work of a batch of
+    directories to a thread pool and queueing the subdirectories left over.
+    Deep or lopsided trees therefore keep every thread busy. Results are
+    merged on the event loop thread, so ``totals`` needs no lock.
+    
+    Raises:
+        Exception: The first error raised while scanning a batch, once the
+                   queue has been drained
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    for root_dir in root_dirs:
+        queue.put_nowait(root_dir)
+    errors = []
+    
+    async def worker(executor):
+        # Stays alive after a failed batch so the queue is always drained
+        while True:
+            path = await queue.get()
+            try:
+                if errors:
+                    continue  # The scan already failed; just drain the queue
+                subdirs, scan = await loop.run_in_executor(
+                    executor, _scan_directories, path, ext_to_category
+                )
+                for subdir in subdirs:
+                    queue.put_nowait(subdir)
+                totals.add(scan)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                queue.task_done()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        workers = [asyncio.create_task(worker(executor)) for _ in range(max_workers)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            # Only the cancellations are collected here; scan errors are in errors
+            await asyncio.gather(*workers, return_exceptions=True)
+    if errors:
+        raise errors[0]
+
+
+def _run_coroutine(coroutine):
+    """Run ``coroutine`` to completion, also when called from inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # asyncio.run cannot nest, so use a private loop in a helper thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+class DataOrganizerSuggester:
+    """Suggests folder structures for organizing unstructured data."""
+    
+    def __init__(self):
+        self.base_structures = _BASE_STRUCTURES
+        self.file_type_mappings = _FILE_TYPE_MAPPINGS
+        self._ext_to_category = _EXT_TO_CATEGORY
     
     def suggest_structure(self, approach='hybrid_approach'):
         """
@@ -180,13 +621,21 @@ class DataOrganizerSuggester:
                           ('by_type', 'by_project', 'by_date', 'hybrid_approach')
         
         Returns:
-            dict: The suggested folder structure
+            Mapping: The suggested folder structure (read-only, shared
+                     between instances)
         """
         if approach not in self.base_structures:
             raise ValueError(f"Unknown approach: {approach}")
         
         return self.base_structures[approach]
     
+    def _approach_of(self, structure):
+        """Return the name of the built-in approach ``structure`` is, if any."""
+        for approach, base_structure in _BASE_STRUCTURES.built_items():
+            if structure is base_structure:
+                return approach
+        return None
+    
     def create_folder_structure(self, base_path, structure, dry_run=True):
         """
         Create the actual folder structure on the filesystem.
@@ -199,76 +648,96 @@ class DataOrganizerSuggester:
         Returns:
             list: List of created/would-be-created folders
         """
-        created_folders = []
-        base_path = Path(base_path)
-        
-        def create_recursive(current_path, struct):
-            for folder_name, contents in struct.items():
-                folder_path = current_path / folder_name
-                created_folders.append(str(folder_path))
-                
-                if not dry_run:
-                    folder_path.mkdir(parents=True, exist_ok=True)
-                    # Create a README file in each folder
-                    readme_path = folder_path / "README.md"
-                    if not readme_path.exists():
-                        with open(readme_path, 'w') as f:
-                            f.write(f"# {folder_name}\n\nThis folder is for organizing {folder_name.lower().replace('_', ' ')} files.\n")
-                
-                if isinstance(contents, dict):
-                    create_recursive(folder_path, contents)
+        approach = self._approach_of(structure)
+        relative_paths = _flatten_structure(approach) if approach else _flatten(structure)
         
-        create_recursive(base_path, structure)
-        return created_folders
+        # Paths are plain strings from here on; no Path object per folder
+        base_path = os.fspath(base_path)
+        folder_paths = [os.path.join(base_path, relative_path) for relative_path in relative_paths]
+        if not dry_run:
+            _materialize(folder_paths)
+        return folder_paths
     
-    def analyze_existing_data(self, data_path):
+    def analyze_existing_data(self, data_path, max_workers=None, sample_size=None):
         """
         Analyze existing unstructured data and suggest appropriate organization.
         
         Args:
             data_path (str): Path to the directory containing unstructured data
+            max_workers (int): Number of threads scanning directories, at least 1
+                             (defaults to the number of CPUs)
+            sample_size (int): If given (at least 1), stop after this many files
+                             and base the analysis on them. Files are taken in
+                             turn from the top-level files and each top-level
+                             directory, so one directory cannot fill the whole
+                             sample, but it is not a uniform random sample.
+                             'sampled' is True in the results when the walk was
+                             cut short; the counts are then lower bounds
         
         Returns:
             dict: Analysis results and recommendations
+        
+        Raises:
+            ValueError: If max_workers or sample_size is less than 1
         """
-        data_path = Path(data_path)
-        if not data_path.exists():
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if sample_size is not None and sample_size < 1:
+            raise ValueError(f"sample_size must be at least 1, got {sample_size}")
+        
+        data_path = os.fspath(data_path)
+        if not os.path.exists(data_path):
             return {"error": f"Path {data_path} does not exist"}
         
         file_analysis = {
             'total_files': 0,
-            'file_types': {},
+            'file_types': Counter(),
+            'category_counts': Counter(),
             'large_files': [],
+            'large_file_count': 0,
+            'sampled': False,
             'recommendations': []
         }
         
-        # Analyze files
-        for file_path in data_path.rglob('*'):
-            if file_path.is_file():
-                file_analysis['total_files'] += 1
-                suffix = file_path.suffix.lower()
-                
-                # Count file types
-                file_analysis['file_types'][suffix] = file_analysis['file_types'].get(suffix, 0) + 1
-                
-                # Check for large files (>100MB)
-                try:
-                    size_mb = file_path.stat().st_size / (1024 * 1024)
-                    if size_mb > 100:
-                        file_analysis['large_files'].append({
-                            'path': str(file_path),
-                            'size_mb': round(size_mb, 2)
-                        })
-                except:
-                    pass
+        # Analyze files: top-level files are scanned here, the directories
+        # below are walked through a shared work queue
+        try:
+            top_level_dirs, top_level_files = _list_directory(data_path)
+        except OSError as e:
+            return {"error": f"Cannot read {data_path}: {e}"}
+        
+        totals = _ScanTotals()
+        if sample_size is not None:
+            # A sample is taken serially so it is the same on every run
+            all_files = _round_robin([top_level_files] + [_iter_files(d) for d in top_level_dirs])
+            totals.add(_scan_entries(islice(all_files, sample_size), self._ext_to_category))
+            # Only a sample if at least one file was left unscanned
+            file_analysis['sampled'] = next(all_files, None) is not None
+        else:
+            totals.add(_scan_entries(top_level_files, self._ext_to_category))
+            if top_level_dirs:
+                # os.cpu_count() returns None when the count is unknown
+                _run_coroutine(_scan_tree_async(
+                    top_level_dirs, self._ext_to_category, totals,
+                    max_workers or os.cpu_count() or 1
+                ))
+        
+        file_analysis['total_files'] = totals.total_files
+        file_analysis['file_types'] = totals.file_types
+        file_analysis['category_counts'] = totals.category_counts
+        file_analysis['large_file_count'] = totals.large_file_count
+        file_analysis['large_files'] = [
+            {'path': path, 'size_mb': round(size_mb, 2)}
+            for size_mb, path in sorted(totals.large_heap, reverse=True)
+        ]
         
         # Generate recommendations
         recommendations = []
         
         # Recommend structure based on file types
-        doc_files = sum(file_analysis['file_types'].get(ext, 0) for ext in self.file_type_mappings['documents'])
-        media_files = sum(file_analysis['file_types'].get(ext, 0) for ext in 
-                         self.file_type_mappings['images'] + self.file_type_mappings['videos'] + self.file_type_mappings['audio'])
+        category_counts = file_analysis['category_counts']
+        doc_files = category_counts['documents']
+        media_files = category_counts['images'] + category_counts['videos'] + category_counts['audio']
         
         if doc_files > media_files:
             recommendations.append("Consider using 'by_project' approach - you have many document files")
@@ -277,7 +746,7 @@ class DataOrganizerSuggester:
         else:
             recommendations.append("Consider using 'hybrid_approach' for balanced organization")
         
-        if len(file_analysis['large_files']) > 0:
+        if file_analysis['large_file_count'] > 0:
             recommendations.append("Consider creating a separate 'Large_Files' folder for files >100MB")
         
         if file_analysis['total_files'] > 1000:
@@ -286,7 +755,8 @@ class DataOrganizerSuggester:
         file_analysis['recommendations'] = recommendations
         return file_analysis
     
-    def generate_organization_plan(self, data_path, approach='hybrid_approach', output_file=None):
+    def generate_organization_plan(self, data_path, approach='hybrid_approach', output_file=None,
+                                   sample_size=None):
         """
         Generate a complete organization plan for the given data.
         
@@ -294,11 +764,12 @@ class DataOrganizerSuggester:
             data_path (str): Path to unstructured data
             approach (str): Organization approach to use
             output_file (str): Optional file to save the plan
+            sample_size (int): Optional sample size, see analyze_existing_data
         
         Returns:
             dict: Complete organization plan
         """
-        analysis = self.analyze_existing_data(data_path)
+        analysis = self.analyze_existing_data(data_path, sample_size=sample_size)
         structure = self.suggest_structure(approach)
         
         plan = {
@@ -318,32 +789,88 @@ class DataOrganizerSuggester:
         }
         
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(plan, f, indent=2)
+            encoded = None
+            if orjson is not None:
+                try:
+                    encoded = orjson.dumps(plan, default=_json_default, option=orjson.OPT_INDENT_2)
+                except orjson.JSONEncodeError:
+                    # e.g. undecodable file names (lone surrogates), which json escapes
+                    encoded = None
+            if encoded is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(encoded)
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(plan, f, indent=2, default=_json_default)
         
         return plan
     
     def print_structure(self, structure, indent=0):
         """Print the folder structure in a readable format."""
-        for folder_name, contents in structure.items():
-            print("  " * indent + f"📁 {folder_name}")
-            if isinstance(contents, dict):
-                self.print_structure(contents, indent + 1)
-            elif isinstance(contents, list) and contents:
-                for item in contents:
-                    print("  " * (indent + 1) + f"📄 {item}")
+        lines = _render(structure, indent)
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
 
-def main():
-    """Main function to demonstrate the data organizer."""
-    organizer = DataOrganizerSuggester()
+def _analyze_one_dir(data_path, sample_size=None):
+    """Analyze a single directory; module-level so worker processes can unpickle it."""
+    return DataOrganizerSuggester().analyze_existing_data(data_path, sample_size=sample_size)
+
+
+def bulk_analyze(data_paths, processes=None, sample_size=None):
+    """
+    Analyze several data directories in parallel, one worker process per directory.
+    
+    Args:
+        data_paths (list): Paths of the directories to analyze
+        processes (int): Number of worker processes (defaults to the number of CPUs)
+        sample_size (int): Optional per-directory sample size, see analyze_existing_data
+    
+    Returns:
+        dict: Analysis results keyed by data path
+    """
+    data_paths = [str(data_path) for data_path in data_paths]
+    with multiprocessing.Pool(processes) as pool:
+        analyses = pool.map(partial(_analyze_one_dir, sample_size=sample_size), data_paths)
+    return dict(zip(data_paths, analyses))
+
+
+def _print_created_folders(folders, dry_run):
+    """Print the outcome of create_folder_structure."""
+    if dry_run:
+        print(f"\n🔍 Dry run - Would create {len(folders)} folders:")
+        for folder in folders[:10]:  # Show first 10
+            print(f"  📁 {folder}")
+        if len(folders) > 10:
+            print(f"  ... and {len(folders) - 10} more folders")
+    else:
+        print(f"\n✅ Created {len(folders)} folders successfully!")
+
+
+def _print_analysis(analysis, data_path=None):
+    """Print the results of analyze_existing_data."""
+    if 'error' in analysis:
+        print(f"\n❌ {analysis['error']}")
+        return
+    
+    print(f"\n📊 Analysis Results{f' for {data_path}' if data_path else ''}:")
+    print(f"Total files: {analysis['total_files']}")
+    print(f"File types found: {len(analysis['file_types'])}")
+    print(f"Large files (>100MB): {analysis['large_file_count']}")
     
+    print("\n💡 Recommendations:")
+    for rec in analysis['recommendations']:
+        print(f"  • {rec}")
+
+
+def _run_interactive(organizer):
+    """Walk the user through the organizer with interactive prompts."""
     print("🗂️  Data Organization Structure Suggester")
     print("=" * 50)
     
     # Show available approaches
     print("\nAvailable Organization Approaches:")
-    approaches = ['by_type', 'by_project', 'by_date', 'hybrid_approach']
+    approaches = list(organizer.base_structures)
     for i, approach in enumerate(approaches, 1):
         print(f"{i}. {approach.replace('_', ' ').title()}")
     
@@ -371,16 +898,7 @@ def main():
             try:
                 dry_run = input("Dry run first? (Y/n): ").strip().lower() != 'n'
                 folders = organizer.create_folder_structure(base_path, structure, dry_run=dry_run)
-                
-                if dry_run:
-                    print(f"\n🔍 Dry run - Would create {len(folders)} folders:")
-                    for folder in folders[:10]:  # Show first 10
-                        print(f"  📁 {folder}")
-                    if len(folders) > 10:
-                        print(f"  ... and {len(folders) - 10} more folders")
-                else:
-                    print(f"\n✅ Created {len(folders)} folders successfully!")
-                    
+                _print_created_folders(folders, dry_run)
             except Exception as e:
                 print(f"\n❌ Error creating folders: {e}")
     
@@ -390,18 +908,7 @@ def main():
         data_path = input("Enter the path to your unstructured data: ").strip()
         if data_path:
             try:
-                analysis = organizer.analyze_existing_data(data_path)
-                if 'error' not in analysis:
-                    print(f"\n📊 Analysis Results:")
-                    print(f"Total files: {analysis['total_files']}")
-                    print(f"File types found: {len(analysis['file_types'])}")
-                    print(f"Large files (>100MB): {len(analysis['large_files'])}")
-                    
-                    print("\n💡 Recommendations:")
-                    for rec in analysis['recommendations']:
-                        print(f"  • {rec}")
-                else:
-                    print(f"\n❌ {analysis['error']}")
+                _print_analysis(organizer.analyze_existing_data(data_path))
             except Exception as e:
                 print(f"\n❌ Error analyzing data: {e}")
     
@@ -409,6 +916,95 @@ def main():
     print("Remember to backup your data before reorganizing!")
 
 
+def _positive_int(value):
+    """argparse type for integers of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _build_parser():
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Suggest folder structures for organizing unstructured data. "
+                    "Runs interactively when no arguments are given."
+    )
+    parser.add_argument('--interactive', action='store_true',
+                        help="ask for every option with interactive prompts")
+    parser.add_argument('--approach', choices=list(_BUILDERS), default='hybrid_approach',
+                        help="organization approach to use (default: %(default)s)")
+    parser.add_argument('--data-path', type=Path, nargs='+', metavar='PATH',
+                        help="directories of unstructured data to analyze; several "
+                             "paths are analyzed in parallel processes")
+    parser.add_argument('--create', type=Path, metavar='BASE_PATH',
+                        help="create the suggested structure under BASE_PATH "
+                             "(a dry run unless --apply is given)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--dry-run', action='store_true',
+                      help="with --create, only list the folders that would be created (default)")
+    mode.add_argument('--apply', action='store_true',
+                      help="with --create, actually create the folders and README files")
+    parser.add_argument('--output', type=Path, metavar='FILE',
+                        help="write the organization plan for a single --data-path as JSON")
+    parser.add_argument('--sample-size', type=_positive_int, metavar='N',
+                        help="analyze at most N files per data path")
+    return parser
+
+
+def main(argv=None):
+    """Main function to run the data organizer from the command line."""
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    organizer = DataOrganizerSuggester()
+    
+    if args.interactive or not argv:
+        _run_interactive(organizer)
+        return
+    
+    if args.output and len(args.data_path or []) != 1:
+        parser.error("--output needs exactly one --data-path")
+    if (args.dry_run or args.apply) and not args.create:
+        parser.error(f"{'--apply' if args.apply else '--dry-run'} needs --create")
+    if args.sample_size is not None and not args.data_path:
+        parser.error("--sample-size needs --data-path")
+    
+    structure = organizer.suggest_structure(args.approach)
+    if args.create:
+        # Like create_folder_structure and the interactive prompt, default to a dry run
+        dry_run = not args.apply
+        try:
+            folders = organizer.create_folder_structure(args.create, structure, dry_run=dry_run)
+            _print_created_folders(folders, dry_run)
+        except OSError as e:
+            print(f"\n❌ Error creating folders: {e}")
+    
+    if args.output:
+        plan = organizer.generate_organization_plan(
+            args.data_path[0], args.approach, output_file=args.output,
+            sample_size=args.sample_size
+        )
+        _print_analysis(plan['analysis'], args.data_path[0])
+        print(f"\n💾 Organization plan saved to {args.output}")
+    elif args.data_path and len(args.data_path) > 1:
+        for data_path, analysis in bulk_analyze(args.data_path, sample_size=args.sample_size).items():
+            _print_analysis(analysis, data_path)
+    elif args.data_path:
+        _print_analysis(
+            organizer.analyze_existing_data(args.data_path[0], sample_size=args.sample_size),
+            args.data_path[0]
+        )
+    
+    if not args.create and not args.data_path:
+        print(f"📋 Suggested Structure ({args.approach.replace('_', ' ').title()}):")
+        print("-" * 40)
+        organizer.print_structure(structure)
+
+
 if __name__ == "__main__":
     main()
-
@@ -2,11 +2,27 @@
 """Test script for the data organizer."""
 
 from data_organizer import DataOrganizerSuggester
+import data_organizer
+import contextlib
+import io
 import json
+import os
+import tempfile
+
+
+def check(failures, description, actual, expected):
+    """Print whether ``actual`` matches ``expected`` and record any mismatch."""
+    if actual == expected:
+        print(f"   ✅ {description}")
+    else:
+        print(f"   ❌ {description}: expected {expected!r}, got {actual!r}")
+        failures.append(description)
+
 
 def test_organizer():
     """Test the basic functionality of the data organizer."""
     organizer = DataOrganizerSuggester()
+    failures = []
     
     print("Testing Data Organizer Functionality...")
     print("=" * 40)
@@ -35,11 +51,122 @@ def test_organizer():
     print(f"   🖼️  Image types: {len(organizer.file_type_mappings['images'])}")
     print(f"   🎵 Audio types: {len(organizer.file_type_mappings['audio'])}")
     
+    # Test analysis of existing data
+    print("\n4. Testing data analysis:")
+    try:
+        with tempfile.TemporaryDirectory() as data_dir:
+            os.makedirs(os.path.join(data_dir, 'nested', 'deeper'))
+            for name in ['report.pdf', 'nested/photo.jpg', 'nested/deeper/notes.txt',
+                         'nested/backup.TAR.GZ']:
+                with open(os.path.join(data_dir, name), 'w') as f:
+                    f.write("sample")
+            # Links are skipped, not counted a second time
+            os.symlink(os.path.join(data_dir, 'report.pdf'), os.path.join(data_dir, 'link.pdf'))
+            os.symlink(os.path.join(data_dir, 'nested'), os.path.join(data_dir, 'linked_dir'))
+            
+            analysis = organizer.analyze_existing_data(data_dir)
+            check(failures, "File types found, symlinks skipped", dict(analysis['file_types']),
+                  {'.pdf': 1, '.jpg': 1, '.txt': 1, '.tar.gz': 1})
+            check(failures, "Total files", analysis['total_files'], 4)
+            check(failures, ".tar.gz classified whole as an archive",
+                  analysis['category_counts']['archives'], 1)
+            
+            sample = organizer.analyze_existing_data(data_dir, sample_size=2)
+            check(failures, "Sample of 2 files", (sample['total_files'], sample['sampled']), (2, True))
+            sample = organizer.analyze_existing_data(data_dir, sample_size=4)
+            check(failures, "Sample covering every file", (sample['total_files'], sample['sampled']), (4, False))
+    except Exception as e:
+        print(f"   ❌ Error in data analysis: {e}")
+        failures.append("data analysis")
+    
+    # Test the cap on listed large files
+    max_large_files = data_organizer._MAX_LARGE_FILES
+    try:
+        # Lower the cap so a few sparse files are enough to exceed it
+        data_organizer._MAX_LARGE_FILES = 2
+        with tempfile.TemporaryDirectory() as data_dir:
+            for name, size_mb in [('a.mp4', 101), ('disk.iso', 103), ('b/c.img', 102)]:
+                path = os.path.join(data_dir, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.truncate(size_mb * 1024 * 1024)
+            analysis = organizer.analyze_existing_data(data_dir)
+            check(failures, "All large files counted above the cap", analysis['large_file_count'], 3)
+            check(failures, "Only the largest files listed, largest first",
+                  [os.path.basename(item['path']) for item in analysis['large_files']],
+                  ['disk.iso', 'c.img'])
+    except Exception as e:
+        print(f"   ❌ Error in large file analysis: {e}")
+        failures.append("large file analysis")
+    finally:
+        data_organizer._MAX_LARGE_FILES = max_large_files
+    
+    # Test writing organization plans, through orjson (if installed) and json
+    json_encoder = data_organizer.orjson
+    try:
+        with tempfile.TemporaryDirectory() as data_dir, tempfile.TemporaryDirectory() as plan_dir:
+            with open(os.path.join(data_dir, 'report.pdf'), 'w') as f:
+                f.write("sample")
+            try:
+                # Not valid UTF-8, so the name decodes with lone surrogates
+                with open(os.path.join(os.fsencode(data_dir), b'bad\xff.\xfe'), 'w') as f:
+                    f.write("sample")
+                expected_types = {'.pdf': 1, '.\udcfe': 1}
+            except (OSError, UnicodeError):
+                expected_types = {'.pdf': 1}  # Filesystem only allows valid names
+            
+            expected_structure = json.loads(json.dumps(
+                organizer.suggest_structure('by_date'), default=dict
+            ))
+            for encoder in dict.fromkeys([json_encoder, None]):
+                data_organizer.orjson = encoder
+                label = "orjson" if encoder else "json"
+                plan_file = os.path.join(plan_dir, f'plan_{label}.json')
+                organizer.generate_organization_plan(data_dir, 'by_date', output_file=plan_file)
+                with open(plan_file) as f:
+                    plan = json.load(f)
+                check(failures, f"Plan written with {label} keeps the structure",
+                      plan['suggested_structure'], expected_structure)
+                check(failures, f"Plan written with {label} keeps the file types",
+                      plan['analysis']['file_types'], expected_types)
+    except Exception as e:
+        print(f"   ❌ Error in organization plan: {e}")
+        failures.append("organization plan")
+    finally:
+        data_organizer.orjson = json_encoder
+    
+    # Test the command line
+    def run_cli(*argv):
+        """Run main() quietly, returning its exit code."""
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            try:
+                data_organizer.main(list(argv))
+            except SystemExit as e:
+                return e.code
+        return 0
+    
+    try:
+        with tempfile.TemporaryDirectory() as base_dir:
+            target = os.path.join(base_dir, 'organized')
+            run_cli('--create', target)
+            check(failures, "--create is a dry run by default", os.path.exists(target), False)
+            run_cli('--create', target, '--apply', '--approach', 'by_date')
+            check(failures, "--create --apply creates the folders",
+                  os.path.isfile(os.path.join(target, '2024', 'README.md')), True)
+            check(failures, "--sample-size below 1 is rejected",
+                  run_cli('--data-path', base_dir, '--sample-size', '0'), 2)
+            check(failures, "--dry-run without --create is rejected", run_cli('--dry-run'), 2)
+    except Exception as e:
+        print(f"   ❌ Error in command line: {e}")
+        failures.append("command line")
+    
     # Show sample structure
-    print("\n4. Sample Hybrid Structure:")
+    print("\n5. Sample Hybrid Structure:")
     structure = organizer.suggest_structure('hybrid_approach')
     organizer.print_structure(structure)
     
+    if failures:
+        raise AssertionError(f"{len(failures)} check(s) failed: {', '.join(failures)}")
     print("\n✅ All tests completed successfully!")
 
 if __name__ == "__main__":